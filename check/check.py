@@ -31,16 +31,20 @@ shutdown_requested = False
 client = None
 db = None
 addresses_col = None
+countries_col = None
 country_status_col = None
 session = None
 worker_id = None
 
 def init_db():
     """Initialize MongoDB connections and indexes"""
-    global client, db, addresses_col, country_status_col
-    client = MongoClient(MONGO_URI)
+    global client, db, addresses_col, countries_col, country_status_col
+    # Same wire compression as the worker: address payloads are highly
+    # repetitive, so zstd/snappy cut most of the bytes on the fetch path
+    client = MongoClient(MONGO_URI, compressors="zstd,snappy,zlib", zlibCompressionLevel=3)
     db = client[DB_NAME]
     addresses_col = db.address
+    countries_col = db.countries
     country_status_col = db.country_status
     
     # Create indexes
@@ -68,10 +72,9 @@ def get_addresses_with_fields(country_code: str, skip: int, limit: int) -> List[
         cursor = addresses_col.find(
             {"country": country_code},
             {
-                "_id": 1, 
+                "_id": 1,
                 "fulladdress": 1,
-                "country": 1, 
-                "country_name": 1
+                "country": 1
             }
         ).skip(skip).limit(limit)
         
@@ -80,6 +83,17 @@ def get_addresses_with_fields(country_code: str, skip: int, limit: int) -> List[
         print(f"Error getting addresses batch: {e}")
         return []
 
+def get_country_name(country_code: str) -> str:
+    """Look up the country name from the countries collection (address
+    documents no longer carry a per-row country_name)"""
+    try:
+        doc = countries_col.find_one({"_id": country_code})
+        if doc and doc.get('name'):
+            return doc['name']
+    except Exception as e:
+        print(f"Error looking up country name for {country_code}: {e}")
+    return country_code
+
 def query_nominatim(address: str) -> Optional[Dict]:
     """Query Nominatim API for address correction"""
     try:
@@ -188,7 +202,7 @@ def update_corrected_address(address_id, corrected_data: Dict) -> bool:
         print(f"[Worker {worker_id}] Error updating address {address_id}: {e}")
         return False
 
-def process_addresses_batch(country_code: str, addresses: List[Dict]) -> Dict:
+def process_addresses_batch(country_code: str, country_name: str, addresses: List[Dict]) -> Dict:
     """Process a batch of addresses"""
     global shutdown_requested
     
@@ -208,8 +222,7 @@ def process_addresses_batch(country_code: str, addresses: List[Dict]) -> Dict:
         try:
             address_id = address['_id']
             fulladdress = address.get('fulladdress', '')
-            country_name = address.get('country_name', country_code)
-            
+
             # Skip if no fulladdress
             if not fulladdress:
                 stats['skipped'] += 1
@@ -345,7 +358,8 @@ def process_country(country_code: str):
             return
         
         print(f"[Worker {worker_id}] Country {country_code} has {total_addresses} addresses")
-        
+        country_name = get_country_name(country_code)
+
         # Process addresses in batches
         skip = 0
         total_stats = {
@@ -366,7 +380,7 @@ def process_country(country_code: str):
                 break
             
             # Process batch
-            batch_stats = process_addresses_batch(country_code, addresses_batch)
+            batch_stats = process_addresses_batch(country_code, country_name, addresses_batch)
             
             # Update totals
             for key in total_stats:
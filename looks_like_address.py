@@ -1,61 +1,66 @@
 import re
 
+# Compiled once at import: the validator runs once per candidate address
+# inside the worker's per-batch loop, and going through re's module-level
+# functions pays a cache lookup plus flag handling on every call
+_NON_WORD_RE = re.compile(r'[^\w]', re.UNICODE)
+_LETTER_RE = re.compile(r'[^\W\d]', re.UNICODE)
+_NO_LETTERS_RE = re.compile(r'^[^a-zA-Z]*$')
+_DIGITS_RE = re.compile(r'[0-9]+')
+
+# Special characters that should not be in addresses
+_SPECIAL_CHARS = frozenset('`:%$@*^[]{}_«»')
+
 def looks_like_address(address: str) -> bool:
     address = address.strip().lower()
 
     # Keep all letters (Latin and non-Latin) and numbers
     # Using a more compatible approach for Unicode characters
-    address_len = re.sub(r'[^\w]', '', address.strip(), flags=re.UNICODE)
+    address_len = _NON_WORD_RE.sub('', address)
     if len(address_len) < 30:
         return False
     if len(address_len) > 300:  # maximum length check
         return False
 
     # Count letters (both Latin and non-Latin) - using \w which includes Unicode letters
-    letter_count = len(re.findall(r'[^\W\d]', address, flags=re.UNICODE))
+    letter_count = len(_LETTER_RE.findall(address))
     if letter_count < 20:
         return False
 
-    if re.match(r"^[^a-zA-Z]*$", address):  # no letters at all
+    if _NO_LETTERS_RE.match(address):  # no letters at all
         return False
     if len(set(address)) < 5:  # all chars basically the same
         return False
-        
+
     # Has at least one digit in a comma-separated section
     # Replace hyphens and semicolons with empty strings before counting numbers
     address_for_number_count = address.replace('-', '').replace(';', '')
-    # Split address by commas and check for numbers in each section
-    sections = [s.strip() for s in address_for_number_count.split(',')]
-    sections_with_numbers = []
-    for section in sections:
-        # Only match ASCII digits (0-9), not other numeric characters
-        number_groups = re.findall(r"[0-9]+", section)
-        if len(number_groups) > 0:
-            sections_with_numbers.append(section)
-    # Need at least 1 section that contains numbers
-    if len(sections_with_numbers) < 1:
+    # Only match ASCII digits (0-9), not other numeric characters; one
+    # matching section is enough, so stop at the first
+    for section in address_for_number_count.split(','):
+        if _DIGITS_RE.search(section):
+            break
+    else:
         return False
 
     if address.count(",") < 2:
         return False
-    
-    # Check for special characters that should not be in addresses
-    special_chars = ['`', ':', '%', '$', '@', '*', '^', '[', ']', '{', '}', '_', '«', '»']
-    if any(char in address for char in special_chars):
+
+    if _SPECIAL_CHARS.intersection(address):
         return False
-    
+
     # # Contains common address words or patterns
     # common_words = ["st", "street", "rd", "road", "ave", "avenue", "blvd", "boulevard", "drive", "ln", "lane", "plaza", "city", "platz", "straße", "straße", "way", "place", "square", "allee", "allee", "gasse", "gasse"]
     # # Also check for common patterns like "1-1-1" (Japanese addresses) or "Unter den" (German)
     # has_common_word = any(word in address for word in common_words)
     # has_address_pattern = re.search(r'\d+-\d+-\d+', address) or re.search(r'unter den|marienplatz|champs|place de', address)
-    
+
     # if not (has_common_word or has_address_pattern):
     #     return False
-    
+
     return True
 
 
 if __name__ == "__main__":
     address = "Musée Océanographique, Avenue Saint-Martin, Monaco, 98000, Monaco"
-    print(looks_like_address(address))
\ No newline at end of file
+    print(looks_like_address(address))